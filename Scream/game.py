@@ -5,8 +5,10 @@ Control character jumping with voice or spacebar
 
 import pygame
 import sys
+import time
 import numpy as np
-from typing import Tuple, List
+from collections import deque
+from typing import Tuple, List, Dict, Union
 import os
 
 # Try importing PyAudio
@@ -33,6 +35,15 @@ PIPE_GAP = 200
 PIPE_WIDTH = 80
 GROUND_HEIGHT = 50
 
+# Frame pacing configuration
+PACING_MODES = ("tick", "hybrid", "busy", "vsync")
+FRAME_PACING = "hybrid"  # Pacing strategy, one of PACING_MODES (F2 cycles in game)
+SPIN_MARGIN_MS = 2.0  # Hybrid mode busy-waits at most this long before each frame deadline
+SPIN_BUDGET = 0.1  # Max share of frame time the hybrid mode may spend busy-waiting
+VSYNC_MIN_PERIOD = 1.0 / 240  # Flips returning faster than this are not vsynced
+VSYNC_FALLBACK = "hybrid"  # Pacing strategy used when vsync is unavailable
+JITTER_WINDOW = 240  # Number of recent frame intervals kept for jitter statistics
+
 # Sound detection configuration
 CHUNK = 1024
 try:
@@ -311,16 +322,138 @@ class Button:
         return self.rect.collidepoint(pos)
 
 
+class FramePacer:
+    """Frame pacer with frame-interval jitter statistics"""
+    
+    def __init__(self, clock, mode: str = FRAME_PACING, fps: int = FPS):
+        self.clock = clock
+        self.fps = fps
+        self.interval = 1.0 / fps  # Target frame interval (seconds)
+        self.mode = mode if mode in PACING_MODES else "tick"
+        self.modes = list(PACING_MODES)  # Strategies F2 cycles through
+        self.flip_period = 0.0  # Measured vsynced display.flip() period (seconds)
+        self.intervals = deque(maxlen=JITTER_WINDOW)
+        self.spins = deque(maxlen=JITTER_WINDOW)
+        self.reset_stats()
+    
+    def reset_stats(self):
+        """Clear collected statistics and restart the frame schedule"""
+        self.intervals.clear()
+        self.spins.clear()
+        self.last_frame = None
+        self.deadline = None
+        self.spin_margin = SPIN_MARGIN_MS / 1000.0  # Current hybrid spin margin (seconds)
+    
+    def set_mode(self, mode: str):
+        """Switch pacing strategy"""
+        self.mode = mode if mode in PACING_MODES else "tick"
+        self.reset_stats()
+    
+    def next_mode(self) -> str:
+        """Get the pacing strategy after the current one"""
+        index = self.modes.index(self.mode) if self.mode in self.modes else -1
+        return self.modes[(index + 1) % len(self.modes)]
+    
+    def wait(self):
+        """Wait until the next frame is due and record the frame interval"""
+        spin = 0.0
+        if self.mode == "hybrid":
+            spin = self.wait_hybrid()
+        elif self.mode == "busy":
+            # tick_busy_loop spins for the whole remaining frame time,
+            # this mode is deliberately not limited by SPIN_BUDGET
+            start = time.perf_counter()
+            self.clock.tick_busy_loop(self.fps)
+            spin = time.perf_counter() - start
+        elif self.mode == "vsync" and self.flip_period >= self.interval * 0.95:
+            # display.flip() already waited for a refresh at or below FPS,
+            # so the display alone sets the frame timing
+            self.clock.tick()
+        else:
+            # On displays faster than FPS (120/144 Hz) vsync cannot hold the frame
+            # rate, so tick's coarse sleep caps it and vsync mode behaves like tick
+            self.clock.tick(self.fps)
+        
+        now = time.perf_counter()
+        if self.last_frame is not None:
+            self.intervals.append(now - self.last_frame)
+            self.spins.append(spin)
+        self.last_frame = now
+    
+    def wait_hybrid(self) -> float:
+        """Sleep through most of the frame, then spin to the deadline; return spin time"""
+        now = time.perf_counter()
+        if self.deadline is None or now > self.deadline + self.interval:
+            # First frame or a late frame: restart the schedule from now without
+            # waiting, like clock.tick, instead of adding a full extra frame
+            self.deadline = now
+            self.clock.tick()
+            return 0.0
+        self.deadline += self.interval
+        
+        # Sleep is coarse, so wake up early and busy-wait the rest. While the
+        # recent spin share is over SPIN_BUDGET, wake up closer to the deadline
+        if self.spin_share() > SPIN_BUDGET:
+            self.spin_margin *= 0.98
+        else:
+            self.spin_margin = min(SPIN_MARGIN_MS / 1000.0, self.spin_margin * 1.01 + 1e-6)
+        remaining = self.deadline - now
+        if remaining > self.spin_margin:
+            time.sleep(remaining - self.spin_margin)
+        
+        spin_start = time.perf_counter()
+        while time.perf_counter() < self.deadline:
+            pass
+        spin = time.perf_counter() - spin_start
+        self.clock.tick()  # Keep clock.get_fps() meaningful
+        return spin
+    
+    def spin_share(self) -> float:
+        """Get the share of recent frame time spent busy-waiting (0-1)"""
+        total = sum(self.intervals)
+        return sum(self.spins) / total if total > 0 else 0.0
+    
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Get frame-interval statistics over the recent window (milliseconds)"""
+        if not self.intervals:
+            return {"frames": 0, "mean_ms": 0.0, "stddev_ms": 0.0,
+                    "max_dev_ms": 0.0, "spin_pct": 0.0}
+        
+        # Deviation is measured from the window mean rather than 1/FPS, since
+        # clock.tick() aims for whole milliseconds (16ms instead of 16.67ms at 60 FPS)
+        intervals = np.array(self.intervals) * 1000.0
+        mean = intervals.mean()
+        return {
+            "frames": len(intervals),
+            "mean_ms": float(mean),
+            "stddev_ms": float(intervals.std()),
+            "max_dev_ms": float(np.abs(intervals - mean).max()),
+            "spin_pct": float(100.0 * self.spin_share()),
+        }
+    
+    def summary(self) -> str:
+        """Get a one-line statistics summary"""
+        stats = self.stats()
+        fps = 1000.0 / stats["mean_ms"] if stats["mean_ms"] > 0 else 0.0
+        return (f"{self.mode.upper()} {stats['mean_ms']:.1f}ms ({fps:.0f}fps) "
+                f"SD {stats['stddev_ms']:.2f}ms "
+                f"MAX {stats['max_dev_ms']:.2f}ms SPIN {stats['spin_pct']:.0f}%")
+
+
 class Game:
     """Main game class"""
     
     def __init__(self):
         pygame.init()
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-        pygame.display.set_caption("Scream - Voice-Controlled Jumping Game")
         self.clock = pygame.time.Clock()
+        self.pacer = FramePacer(self.clock)
+        self.show_pacing_stats = False
+        self.screen = None
+        self.switch_pacing(self.pacer.mode)
+        pygame.display.set_caption("Scream - Voice-Controlled Jumping Game")
         self.font = pygame.font.Font(None, 36)
         self.big_font = pygame.font.Font(None, 72)
+        self.small_font = pygame.font.Font(None, 24)
         
         # Sound detector
         self.sound_detector = SoundDetector()
@@ -343,6 +476,47 @@ class Game:
         except Exception as e:
             print(f"Failed to load background image: {e}")
     
+    def set_display_mode(self, vsync: bool) -> bool:
+        """Create the game window; return whether vsync was enabled"""
+        if vsync:
+            try:
+                # SDL only honours vsync for renderer-backed (SCALED/OPENGL) windows.
+                # Side effect: on high-DPI desktops SCALED enlarges the window by a
+                # whole-number factor, so entering vsync mode can resize the window
+                self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT),
+                                                      pygame.SCALED, vsync=1)
+                # set_mode can succeed without vsync (e.g. software renderer),
+                # so check that flip() actually blocks on the display refresh
+                self.pacer.flip_period = self.measure_flip_period()
+                if self.pacer.flip_period >= VSYNC_MIN_PERIOD:
+                    return True
+                print("Display flip does not wait for refresh, vsync not active")
+            except pygame.error as e:
+                print(f"Failed to enable vsync: {e}")
+        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        return False
+    
+    def measure_flip_period(self, flips: int = 5) -> float:
+        """Time a few display flips and return the average period (seconds)"""
+        self.screen.fill(BLACK)
+        pygame.display.flip()  # The first flip may include renderer setup
+        start = time.perf_counter()
+        for _ in range(flips):
+            pygame.display.flip()
+        return (time.perf_counter() - start) / flips
+    
+    def switch_pacing(self, mode: str):
+        """Switch frame pacing strategy, creating the window when needed"""
+        if self.screen is None or mode == "vsync" or self.pacer.mode == "vsync":
+            if not self.set_display_mode(mode == "vsync") and mode == "vsync":
+                print(f"Vsync unavailable, using {VSYNC_FALLBACK} frame pacing")
+                mode = VSYNC_FALLBACK
+                # Leave vsync out of the F2 cycle from now on
+                if "vsync" in self.pacer.modes:
+                    self.pacer.modes.remove("vsync")
+        self.pacer.set_mode(mode)
+        print(f"Frame pacing: {mode}")
+    
     def reset_game(self):
         """Reset game"""
         self.bird = Bird(100, WINDOW_HEIGHT // 2)
@@ -388,6 +562,12 @@ class Game:
                     self.bird.velocity = JUMP_STRENGTH
                 elif event.key == pygame.K_ESCAPE:
                     return False
+                elif event.key == pygame.K_F2:
+                    # Cycle frame pacing strategy
+                    self.switch_pacing(self.pacer.next_mode())
+                elif event.key == pygame.K_F3:
+                    # Toggle frame pacing statistics
+                    self.show_pacing_stats = not self.show_pacing_stats
         
         return True
     
@@ -496,6 +676,11 @@ class Game:
                 # Display restart button
                 self.restart_button.draw(self.screen, self.font)
         
+        # Frame pacing statistics in top-left corner
+        if self.show_pacing_stats:
+            stats_text = self.small_font.render(self.pacer.summary(), True, WHITE)
+            self.screen.blit(stats_text, (10, 10))
+        
         pygame.display.flip()
     
     def draw_sound_test(self):
@@ -558,7 +743,9 @@ class Game:
             running = self.handle_events()
             self.update()
             self.draw()
-            self.clock.tick(FPS)
+            self.pacer.wait()
+        
+        print(f"Frame pacing: {self.pacer.summary()}")
         
         # Clean up resources
         self.sound_detector.cleanup()